@@ -0,0 +1,95 @@
+# !usr/bin/env python3
+
+"""An indexed d-ary min-heap over the closed set of integer vertex ids
+0..n-1, supporting decrease-key in O(log_d n). The wider fan-out (d = 4
+by default) makes sift-downs shallower and more cache-friendly than a
+binary heap's, and the position index lets a vertex's priority be
+updated in place instead of pushing duplicate entries the way the
+lazy-deletion heapq variants do. Dijkstra's algorithm is the intended
+customer: its candidate set is exactly the known, closed set of graph
+vertices, so the key and position tables can be flat lists.
+"""
+
+from math import inf
+
+
+class DaryHeap:
+    """Min-heap of integer vertex ids keyed by priority, with a position
+    index so membership tests and key decreases are O(1) lookups.
+    """
+
+    def __init__(self, n: int, d: int = 4) -> None:
+        self.d = d
+        self.heap = []  # type: list[int]  # Vertex ids in heap order.
+        self.key = [inf] * n  # Priority of each vertex id.
+        self.pos = [-1] * n  # Position of each vertex in heap (-1 = absent).
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, v: int) -> bool:
+        return self.pos[v] >= 0
+
+    def push(self, v: int, k: float) -> None:
+        """Inserts v with key k, or decreases its key if already present."""
+        if self.pos[v] >= 0:
+            self.decrease(v, k)
+            return
+        self.key[v] = k
+        self.pos[v] = len(self.heap)
+        self.heap.append(v)
+        self._sift_up(self.pos[v])
+
+    def decrease(self, v: int, k: float) -> None:
+        """Lowers the key of v in place; larger keys are ignored."""
+        if k < self.key[v]:
+            self.key[v] = k
+            self._sift_up(self.pos[v])
+
+    def pop(self) -> tuple[float, int]:
+        """Removes and returns the (key, vertex) pair with the smallest key."""
+        heap, pos = self.heap, self.pos
+        root = heap[0]
+        pos[root] = -1
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            pos[last] = 0
+            self._sift_down(0)
+        return self.key[root], root
+
+    def _sift_up(self, i: int) -> None:
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        v = heap[i]
+        k = key[v]
+        while i > 0:
+            parent = (i - 1) // d
+            p = heap[parent]
+            if key[p] <= k:
+                break
+            heap[i] = p
+            pos[p] = i
+            i = parent
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        n = len(heap)
+        v = heap[i]
+        k = key[v]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for j in range(first + 1, min(first + d, n)):
+                if key[heap[j]] < key[heap[best]]:
+                    best = j
+            if key[heap[best]] >= k:
+                break
+            heap[i] = heap[best]
+            pos[heap[i]] = i
+            i = best
+        heap[i] = v
+        pos[v] = i
@@ -1,12 +1,16 @@
 # !usr/bin/env python3
 
-"""An implementation of Dijkstra's algorithm (No heap or priority queue)
-written in Python. Dijkstra's algorithm finds the shortest path between
-two vertices when given a graph with non-negative edge weights.
+"""An implementation of Dijkstra's algorithm written in Python.
+Dijkstra's algorithm finds the shortest path between two vertices
+when given a graph with non-negative edge weights.
 Note:
     - The implementation of this algorithm differs from the version given
     in the references because the input for the graph is in the form of
     nested dictionaries instead of arrays.
+    - The next vertex to settle is picked with a lazy-deletion binary heap
+    (push on every improvement, skip entries that are already settled when
+    popped), which runs in O((V+E) log V) instead of the O(V^2) linear
+    scan over the unvisited set.
     - Dijkstra's algorithm does not work with negative edge weights.
     - The following code is original, and has not been taken from anywhere else,
     apart from borrowing some ideas from the pseudocode in the Wikipedia entry.
@@ -16,7 +20,7 @@ References:
     - https://www.youtube.com/watch?v=XB4MIexjvY0&ab_channel=AbdulBari
 """
 
-from collections import deque
+from heapq import heappop, heappush
 from math import inf
 from pprint import pprint
 from typing import Mapping, TypeVar, overload
@@ -45,46 +49,144 @@ K = TypeVar("K")
 V = TypeVar("V", bound=float)
 
 
+def _dijkstra_dist_only(graph, src):
+    """Distance-only variant of the search: no predecessors are tracked,
+    which saves a dict write per relaxed edge for callers that never
+    reconstruct a path.
+    """
+    dist = {src: 0}
+    heap = [(0, src)]
+    visited = set()
+    while heap:
+        d, u = heappop(heap)
+        if u in visited:
+            continue
+        visited.add(u)
+        for v, w in graph[u].items():
+            if v in visited:
+                continue
+            alt = d + w
+            if alt < dist.get(v, inf):
+                dist[v] = alt
+                heappush(heap, (alt, v))
+    return dist
+
+
+def _dijkstra_dense_ids(graph, src, dst=-1):
+    """Fast path for graphs whose vertices are exactly the integers
+    0..n-1 (as produced by relabelling, or integer grids): dist and prev
+    live in flat lists indexed by vertex id, and the visited set is a
+    byte per vertex, replacing a hash probe per access with plain
+    indexing.
+    """
+    n = len(graph)
+    dist = [inf] * n
+    prev = [-1] * n
+    dist[src] = 0
+    heap = [(0, src)]
+    visited = bytearray(n)
+    best = inf  # Best known distance to dst; nothing costlier can help it.
+    while heap:
+        d, u = heappop(heap)
+        if visited[u]:
+            continue
+        visited[u] = 1
+        if u == dst:
+            break
+        for v, w in graph[u].items():
+            if visited[v]:
+                continue
+            alt = d + w
+            if alt >= best:
+                continue
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                if v == dst:
+                    best = alt
+                heappush(heap, (alt, v))
+    return dist, prev
+
+
 @overload
 def dijkstra(graph: Mapping[K, Mapping[K, V]], src: K) -> tuple[dict[K, V], dict[K, K]]:
     ...
 
 
 @overload
-def dijkstra(graph: Mapping[K, Mapping[K, V]], src: K, dst: K) -> tuple[deque[K], V]:
+def dijkstra(graph: Mapping[K, Mapping[K, V]], src: K, dst: K) -> tuple[list[K], V]:
     ...
 
 
-def dijkstra(graph, src, dst=None):  # type: ignore
+def dijkstra(graph, src, dst=None, *, return_predecessors=True):  # type: ignore
     """Returns the shortest distance (or path) between any two vertices
-    when given a weighted graph.
+    when given a weighted graph. When no destination is given and
+    return_predecessors is False, only the distance dict is returned and
+    predecessor bookkeeping is skipped entirely.
+
+    The returned dicts hold entries only for vertices reached from the
+    source -- a vertex missing from the distance dict is unreachable.
+    Graphs whose vertices are exactly the integers 0..n-1 are routed to
+    a list-indexed fast path with identical results.
+    Seeding them with just the source keeps initialization O(1) rather
+    than O(V), which pays off when the destination is settled early.
 
     References:
         - https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
     """
-    dist = dict.fromkeys(graph, inf)
-    prev = dict.fromkeys(graph, None)
-    dist[src] = 0
-    unmarked = set(graph)
-    while unmarked:
-        u = min(unmarked, key=dist.get)  # type: ignore
-        unmarked.remove(u)
+    if dst is None and not return_predecessors:
+        return _dijkstra_dist_only(graph, src)
+    if isinstance(next(iter(graph), None), int) and set(graph) == set(range(len(graph))):
+        dists, prevs = _dijkstra_dense_ids(graph, src, -1 if dst is None else dst)
+        if dst is None:
+            return (
+                {v: d for v, d in enumerate(dists) if d != inf},
+                {v: p for v, p in enumerate(prevs) if p >= 0},
+            )
+        path = []
+        i = dst
+        while i >= 0:
+            path.append(i)
+            i = prevs[i]
+        path.reverse()
+        return path, dists[dst]
+    dist = {src: 0}
+    prev = {}
+    heap = [(0, src)]
+    visited = set()
+    # Best known distance to dst; relaxations at or past it cannot lie
+    # on a shorter path to the destination.
+    best = inf
+    while heap:
+        d, u = heappop(heap)
+        if u in visited:
+            continue  # Stale entry -- u was already settled with a smaller key.
+        visited.add(u)
         if u == dst:
             break
-        neighbours = graph[u].keys()
-        for v in neighbours & unmarked:
-            alt = dist[u] + graph[u][v]
-            if alt < dist[v]:
+        for v, w in graph[u].items():
+            if v in visited:
+                continue  # Settled vertices already hold their final distance.
+            alt = d + w
+            if alt >= best:
+                continue
+            if alt < dist.get(v, inf):
                 dist[v] = alt
                 prev[v] = u
-    else:
+                if v == dst:
+                    best = alt
+                heappush(heap, (alt, v))
+    if dst is None:
         return dist, prev
-    path = deque[K]()
+    # A list filled back-to-front and reversed once beats a deque's
+    # per-node appendleft in CPython.
+    path = []
     pred = dst
     while pred is not None:
-        path.appendleft(pred)
+        path.append(pred)
         pred = prev.get(pred)
-    return path, dist[dst]
+    path.reverse()
+    return path, dist.get(dst, inf)
 
 
 def test_pathfinding(graph: Mapping[K, Mapping[K, V]], dst: K) -> None:
@@ -0,0 +1,86 @@
+# !usr/bin/env python3
+
+"""Bidirectional Dijkstra for single-pair queries. Two lazy-deletion
+searches run at once -- one forward from the source and one backward
+from the target over the reversed edges -- and the search stops as soon
+as the sum of the two frontier keys can no longer beat the best meeting
+point found so far. On graphs with bounded degree this settles roughly
+half the vertices a one-sided search would.
+References:
+    - https://en.wikipedia.org/wiki/Bidirectional_search
+"""
+
+from heapq import heappop, heappush
+from math import inf
+from typing import Mapping, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V", bound=float)
+
+
+def reverse_graph(graph: Mapping[K, Mapping[K, V]]) -> dict[K, dict[K, V]]:
+    """Returns the graph with every edge reversed."""
+    rev = {u: {} for u in graph}  # type: dict[K, dict[K, V]]
+    for u, nbrs in graph.items():
+        for v, w in nbrs.items():
+            rev[v][u] = w
+    return rev
+
+
+def dijkstra_bidir(
+    graph: Mapping[K, Mapping[K, V]], src: K, dst: K
+) -> tuple[list[K], float]:
+    """Returns the shortest path and distance between two vertices by
+    expanding forward and backward frontiers simultaneously.
+    """
+    if src == dst:
+        return [src], 0
+    rev = reverse_graph(graph)
+    heap_f, heap_b = [(0, src)], [(0, dst)]
+    dist_f, dist_b = {src: 0}, {dst: 0}
+    prev_f, prev_b = {}, {}
+    visited_f, visited_b = set(), set()
+    best = inf
+    meet = None
+
+    def settle(heap, adj, dist, prev, visited, other_dist):
+        """Settles one vertex on one side, recording any improved
+        meeting point with the opposite frontier.
+        """
+        nonlocal best, meet
+        d, u = heappop(heap)
+        if u in visited:
+            return
+        visited.add(u)
+        for v, w in adj[u].items():
+            alt = d + w
+            if alt < dist.get(v, inf):
+                dist[v] = alt
+                prev[v] = u
+                heappush(heap, (alt, v))
+            through = alt + other_dist.get(v, inf)
+            if through < best:
+                best, meet = through, v
+
+    while heap_f and heap_b:
+        # Any path not yet found costs at least the sum of the frontier keys.
+        if heap_f[0][0] + heap_b[0][0] >= best:
+            break
+        if heap_f[0][0] <= heap_b[0][0]:
+            settle(heap_f, graph, dist_f, prev_f, visited_f, dist_b)
+        else:
+            settle(heap_b, rev, dist_b, prev_b, visited_b, dist_f)
+
+    if meet is None:
+        return [dst], inf
+    path = []
+    pred = meet
+    while pred is not None:
+        path.append(pred)
+        pred = prev_f.get(pred)
+    path.reverse()
+    succ = prev_b.get(meet)
+    while succ is not None:
+        path.append(succ)
+        succ = prev_b.get(succ)
+    return path, best
@@ -0,0 +1,79 @@
+# !usr/bin/env python3
+
+"""A delta-stepping variant of Dijkstra's algorithm. Instead of settling
+one vertex at a time in strict priority order, vertices are binned into
+buckets of width delta: light edges (weight <= delta) are relaxed
+repeatedly inside a bucket until it empties, then heavy edges of the
+settled batch are relaxed once into later buckets. Bucket operations
+are O(1), and because every vertex in a bucket can be relaxed in one
+batch the structure is friendly to parallel execution, although this
+implementation processes each batch sequentially.
+References:
+    - https://en.wikipedia.org/wiki/Parallel_single-source_shortest_path_algorithm
+"""
+
+from math import inf
+from typing import Mapping, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V", bound=float)
+
+
+def dijkstra_delta(
+    graph: Mapping[K, Mapping[K, V]], src: K, delta: float = None  # type: ignore
+) -> tuple[dict[K, float], dict[K, K]]:
+    """Returns the distance and predecessor dicts for every vertex
+    reachable from the source, using buckets of width delta instead of a
+    priority queue. When delta is omitted, it defaults to the average
+    edge weight divided by the maximum out-degree, which keeps bucket
+    sizes modest on typical inputs.
+    """
+    if delta is None:
+        weights = [w for nbrs in graph.values() for w in nbrs.values()]
+        degree = max(map(len, graph.values()), default=0)
+        delta = sum(weights) / len(weights) / degree if weights else 1
+        delta = delta or 1  # All-zero weights would otherwise compute 0.
+    elif delta <= 0:
+        raise ValueError("delta must be positive.")
+    light = {u: [] for u in graph}  # type: dict[K, list[tuple[K, V]]]
+    heavy = {u: [] for u in graph}  # type: dict[K, list[tuple[K, V]]]
+    for u, nbrs in graph.items():
+        for v, w in nbrs.items():
+            (light if w <= delta else heavy)[u].append((v, w))
+    tent = {src: 0}
+    prev = {}
+    buckets = {}  # type: dict[int, set[K]]
+
+    def relax(v: K, alt: float, u: K) -> None:
+        """Moves v into the bucket matching its improved distance."""
+        old = tent.get(v, inf)
+        if alt < old:
+            if old != inf:
+                bucket = buckets.get(int(old // delta))
+                if bucket is not None:
+                    bucket.discard(v)
+            tent[v] = alt
+            prev[v] = u
+            buckets.setdefault(int(alt // delta), set()).add(v)
+
+    buckets[0] = {src}
+    while True:
+        buckets = {i: b for i, b in buckets.items() if b}
+        if not buckets:
+            break
+        i = min(buckets)
+        settled = set()
+        # Light edges may re-fill the current bucket; drain until stable.
+        while buckets.get(i):
+            members = buckets.pop(i)
+            settled |= members
+            for u in members:
+                du = tent[u]
+                for v, w in light[u]:
+                    relax(v, du + w, u)
+        # Heavy edges always land in a later bucket, so one pass suffices.
+        for u in settled:
+            du = tent[u]
+            for v, w in heavy[u]:
+                relax(v, du + w, u)
+    return tent, prev
@@ -0,0 +1,71 @@
+# !usr/bin/env python3
+
+"""Dial's algorithm: Dijkstra with a bucket queue, for graphs whose edge
+weights are small non-negative integers. With a maximum weight of C,
+every tentative distance fits in 0..(n-1)*C, so the priority queue can
+be an array of buckets indexed by distance -- extract-min is "advance
+to the next non-empty bucket" in amortized O(1) instead of a heap's
+O(log V), giving O(E + V*C) overall.
+References:
+    - https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm#Specialized_variants
+"""
+
+from math import inf
+from typing import Mapping, TypeVar
+
+from dijkstra_csr import csr_for
+
+K = TypeVar("K")
+V = TypeVar("V", bound=float)
+
+
+def dijkstra_dial(graph: Mapping[K, Mapping[K, int]], src: K, dst: K = None):  # type: ignore
+    """Same interface and return shapes as dijkstra_csr.dijkstra, with
+    the heap replaced by a distance-indexed bucket array. Raises
+    ValueError for graphs with non-integer edge weights.
+    """
+    csr = csr_for(graph)
+    if csr.weights.typecode != "q":
+        raise ValueError("Dial's algorithm requires integer edge weights.")
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    index = csr.index
+    vertices = list(index)
+    n = len(csr)
+    top = max(weights, default=0)
+    dist = [inf] * n
+    prev = [-1] * n
+    s = index[src]
+    target = -1 if dst is None else index[dst]
+    dist[s] = 0
+    buckets = [[] for _ in range((n - 1) * top + 1)]
+    buckets[0].append(s)
+    done = False
+    for cur, bucket in enumerate(buckets):
+        if done:
+            break
+        while bucket:
+            u = bucket.pop()
+            if dist[u] != cur:
+                continue  # Stale entry -- u moved to an earlier bucket.
+            if u == target:
+                done = True
+                break
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                alt = cur + weights[k]
+                if alt < dist[v]:
+                    dist[v] = alt
+                    prev[v] = u
+                    buckets[alt].append(v)
+    if dst is None:
+        return (
+            {v: dist[i] for i, v in enumerate(vertices)},
+            {v: None if prev[i] < 0 else vertices[prev[i]] for i, v in enumerate(vertices)},
+        )
+    path = []
+    i = index[dst]
+    while i >= 0:
+        path.append(vertices[i])
+        i = prev[i]
+    path.reverse()
+    return path, dist[index[dst]]
@@ -0,0 +1,58 @@
+# !usr/bin/env python3
+
+"""Dijkstra's algorithm backed by the indexed 4-ary heap from
+dary_heap.py instead of heapq with lazy deletion. The queue never holds
+more than one entry per vertex: improving a tentative distance is an
+in-place decrease-key, so the heap stays bounded by V where the lazy
+variants can accumulate up to E stale duplicates.
+"""
+
+from math import inf
+from typing import Mapping, TypeVar
+
+from dary_heap import DaryHeap
+from dijkstra_csr import csr_for
+
+K = TypeVar("K")
+V = TypeVar("V", bound=float)
+
+
+def dijkstra_indexed(graph: Mapping[K, Mapping[K, V]], src: K, dst: K = None):  # type: ignore
+    """Same interface and return shapes as dijkstra_csr.dijkstra, with
+    the lazy heapq replaced by a decrease-key priority queue.
+    """
+    csr = csr_for(graph)
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    index = csr.index
+    vertices = list(index)
+    n = len(csr)
+    dist = [inf] * n
+    prev = [-1] * n
+    s = index[src]
+    t = -1 if dst is None else index[dst]
+    dist[s] = 0
+    heap = DaryHeap(n)
+    heap.push(s, 0)
+    while heap:
+        d, u = heap.pop()
+        if u == t:
+            break
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            alt = d + weights[k]
+            if alt < dist[v]:
+                dist[v] = alt
+                prev[v] = u
+                heap.push(v, alt)  # An in-place decrease-key when v is queued.
+    if dst is None:
+        return (
+            {v: dist[i] for i, v in enumerate(vertices)},
+            {v: None if prev[i] < 0 else vertices[prev[i]] for i, v in enumerate(vertices)},
+        )
+    path = []
+    i = index[dst]
+    while i >= 0:
+        path.append(vertices[i])
+        i = prev[i]
+    path.reverse()
+    return path, dist[index[dst]]
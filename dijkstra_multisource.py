@@ -0,0 +1,56 @@
+# !usr/bin/env python3
+
+"""Multi-source Dijkstra: one search seeded with every source at
+distance zero instead of K independent runs. Each vertex ends up with
+the distance to its nearest seed, and a source_of map records which
+seed won it -- the graph Voronoi partition -- so K-source workloads pay
+for a single traversal of the graph.
+"""
+
+from heapq import heapify, heappop, heappush
+from math import inf
+from typing import Iterable, Mapping, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V", bound=float)
+
+
+def dijkstra_multisource(
+    graph: Mapping[K, Mapping[K, V]], sources: Iterable[K], dst: K = None  # type: ignore
+):
+    """Returns (dist, prev, source_of) dicts covering every vertex
+    reached from any of the seeds, where source_of[v] names the seed
+    that settled v. With a destination, returns the (path, dist) pair
+    from the nearest seed instead, like the single-source modules.
+    """
+    dist = dict.fromkeys(sources, 0)
+    prev = {}
+    source_of = {s: s for s in dist}
+    heap = [(0, s) for s in dist]
+    heapify(heap)  # One O(K) heapify instead of K pushes.
+    visited = set()
+    while heap:
+        d, u = heappop(heap)
+        if u in visited:
+            continue
+        visited.add(u)
+        if u == dst:
+            break
+        for v, w in graph[u].items():
+            if v in visited:
+                continue
+            alt = d + w
+            if alt < dist.get(v, inf):
+                dist[v] = alt
+                prev[v] = u
+                source_of[v] = source_of[u]
+                heappush(heap, (alt, v))
+    if dst is None:
+        return dist, prev, source_of
+    path = []
+    pred = dst
+    while pred is not None:
+        path.append(pred)
+        pred = prev.get(pred)
+    path.reverse()
+    return path, dist.get(dst, inf)
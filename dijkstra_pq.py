@@ -2,11 +2,12 @@
 Dijkstra's algorithm finds the shortest path between two vertices when given a graph
 with positive edge weights.
 
-The priority queue data structure is emulated using the 'heapq' module.
+The priority queue data structure is emulated using the 'heapq' module, with lazy
+deletion: a vertex is pushed again whenever its distance improves, and stale heap
+entries are skipped when popped.
 """
 
 import heapq
-from collections import deque
 from math import inf
 from pprint import pprint
 from typing import Any, Hashable, Union
@@ -15,40 +16,58 @@ Vertex = Hashable
 Graph = dict[Vertex, dict[Vertex, Union[int, float]]]
 
 
+def _validate_weights(graph: Graph) -> None:
+    """Raises if any edge weight is negative. Non-negative weights are a
+    property of the graph, not of a single search, so they are checked
+    once up front instead of per relaxed edge inside the main loop.
+    """
+    for neighbours in graph.values():
+        for cost in neighbours.values():
+            if cost < 0:
+                raise ValueError("Edge cannot have a negative value.")
+
+
 def dijkstra(graph: Graph, source: Vertex, target: Vertex = None) -> tuple[Any, Any]:
     """Dijkstra's algorithm, but with a priority queue."""
 
-    previous, unvisited = {}, []
-
-    for vertex in graph:
-        heapq.heappush(unvisited, (0 if vertex == source else inf, vertex))
+    if source not in graph:
+        raise LookupError(f"Source {source!r} is not in the graph.")
+    if target is not None and target not in graph:
+        raise LookupError(f"Target {target!r} is not in the graph.")
 
-    distance = dict(map(reversed, unvisited))
+    _validate_weights(graph)
+    unvisited = [(0, source)]
+    distance = {source: 0}
+    previous = {}
 
     while unvisited:
         # Remove and get next best vertex.
-        _, nearest = heapq.heappop(unvisited)
+        nearest_distance, nearest = heapq.heappop(unvisited)
+
+        if nearest_distance > distance.get(nearest, inf):
+            continue  # Stale entry -- nearest was re-pushed with a smaller distance.
 
         if nearest == target:
             break
 
         for neighbour, cost in graph[nearest].items():
-            if cost < 0:
-                raise ValueError("Edge cannot have a negative value.")
-            alternative = distance[nearest] + cost
-            if alternative < distance[neighbour]:
+            alternative = nearest_distance + cost
+            if alternative < distance.get(neighbour, inf):
                 distance[neighbour] = alternative
                 previous[neighbour] = nearest
-    else:
+                heapq.heappush(unvisited, (alternative, neighbour))
+
+    if target is None:
         return previous, distance
 
-    path = deque()
+    path = []
     predecessor = target
 
     # Reconstruct the shortest path by traversing
     # from the target back to the source.
     while predecessor is not None:
-        path.appendleft(predecessor)
+        path.append(predecessor)
         predecessor = previous.get(predecessor)
+    path.reverse()
 
-    return path, distance[target]
+    return path, distance.get(target, inf)